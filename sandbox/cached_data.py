@@ -0,0 +1,81 @@
+# Disk cache for the data preparation shared by the sandbox scripts.
+#
+# The step-by-step scripts all load the same point cloud and footprints,
+# build the terrain raster and compute building heights before getting to
+# the step they are meant to debug. The result is cached on disk with
+# joblib, keyed on the input file paths, modification times and sizes and
+# the installed dtcc-core version, so that re-runs skip LAS parsing and
+# raster construction.
+#
+# Note that joblib is required for this (pip install joblib), it is not a
+# dependency of dtcc. An editable dtcc-core install keeps its version when
+# the source is edited, so set DTCC_SANDBOX_NO_CACHE=1 (or pass
+# use_cache=False) to recompute after changing dtcc-core.
+
+import os
+from importlib.metadata import version
+from pathlib import Path
+
+import dtcc
+from joblib import Memory
+
+memory = Memory(Path(__file__).parent / ".cache", verbose=0)
+
+
+def _file_key(path):
+    stat = Path(path).stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@memory.cache
+def _prepare_data(
+    buildings_key, pointcloud_key, core_version, outlier_margin, cell_size, radius
+):
+    footprints = dtcc.io.load_footprints(buildings_key[0], "uuid")
+
+    pc = dtcc.io.load_pointcloud(pointcloud_key[0])
+    pc = pc.remove_global_outliers(outlier_margin)
+
+    terrain_raster = dtcc.builder.build_terrain_raster(
+        pc, cell_size=cell_size, radius=radius, ground_only=True
+    )
+
+    # calculate the building heights
+    footprints = dtcc.builder.extract_roof_points(
+        footprints, pc, statistical_outlier_remover=True
+    )
+    footprints = dtcc.builder.compute_building_heights(
+        footprints, terrain_raster, overwrite=True
+    )
+
+    return footprints, pc, terrain_raster
+
+
+def prepare_data(
+    buildings_path,
+    pointcloud_path,
+    outlier_margin=3,
+    cell_size=2,
+    radius=3,
+    use_cache=None,
+):
+    """Load footprints and point cloud, build terrain raster and compute
+    building heights, reusing the cached result if the inputs and the
+    dtcc-core version are unchanged.
+
+    The cache is bypassed if use_cache is False, or if use_cache is None and
+    the environment variable DTCC_SANDBOX_NO_CACHE is set.
+
+    Returns a tuple (footprints, pointcloud, terrain_raster).
+    """
+    if use_cache is None:
+        use_cache = not os.environ.get("DTCC_SANDBOX_NO_CACHE")
+    prepare = _prepare_data if use_cache else _prepare_data.func
+    return prepare(
+        _file_key(buildings_path),
+        _file_key(pointcloud_path),
+        version("dtcc-core"),
+        outlier_margin,
+        cell_size,
+        radius,
+    )
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import dtcc
+import numpy as np
 
 
 from dtcc_builder.model import (
@@ -17,27 +18,14 @@ from dtcc_builder import _dtcc_builder
 
 from pathlib import Path
 
+from cached_data import prepare_data
+
 data_directory = Path(__file__).parent / ".." / "data" / "HelsingborgResidential2022"
 buildings_path = data_directory / "PropertyMap.shp"
 pointcloud_path = data_directory / "PointCloud.las"
 
-footprints = dtcc.io.load_footprints(buildings_path, "uuid")
-
-pc = dtcc.io.load_pointcloud(pointcloud_path)
-pc = pc.remove_global_outliers(3)
-
-terrain_raster = dtcc.builder.build_terrain_raster(
-    pc, cell_size=2, radius=3, ground_only=True
-)
-
-# caluclate the building heights
-footprints = dtcc.builder.extract_roof_points(
-    footprints, pc, statistical_outlier_remover=True
-)
-
-footprints = dtcc.builder.compute_building_heights(
-    footprints, terrain_raster, overwrite=True
-)
+# load data, build terrain raster and calculate the building heights (cached)
+footprints, pc, terrain_raster = prepare_data(buildings_path, pointcloud_path)
 
 # merge and simplify the building footprints
 merged_footprints = dtcc.builder.merge_building_footprints(
@@ -48,18 +36,24 @@ simplifed_footprints = dtcc.builder.simplify_building_footprints(
 )
 clearance_fix = dtcc.builder.fix_building_footprint_clearance(simplifed_footprints, 0.5)
 
-# set subdomain resolution to half the building height
-subdomain_resolution = [building.height / 2 for building in clearance_fix]
+# drop missing buildings once so that all per-building lists line up
+valid_buildings = [building for building in clearance_fix if building is not None]
+
+# set subdomain resolution to half the building height, capped at the mesh size
+max_mesh_size = 10
+building_heights = np.fromiter(
+    (building.height for building in valid_buildings),
+    dtype=np.float64,
+    count=len(valid_buildings),
+)
+subdomain_resolution = np.minimum(building_heights * 0.5, max_mesh_size)
 
 # convert to C++ classes
 builder_dem = raster_to_builder_gridfield(terrain_raster)
 builder_surfaces = [
-    create_builder_surface(building.lod0)
-    for building in clearance_fix
-    if building is not None
+    create_builder_surface(building.lod0) for building in valid_buildings
 ]
 
-max_mesh_size = 10
 min_mesh_angle = 25
 smoothing = 3
 merge_meshes = True
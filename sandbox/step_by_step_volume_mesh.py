@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import dtcc
+import numpy as np
 
 
 from dtcc_builder.model import (
@@ -18,6 +19,8 @@ from dtcc_builder import _dtcc_builder
 
 from pathlib import Path
 
+from cached_data import prepare_data
+
 from time import time
 
 import sys
@@ -26,23 +29,8 @@ data_directory = Path(__file__).parent / ".." / "data" / "HelsingborgResidential
 buildings_path = data_directory / "PropertyMap.shp"
 pointcloud_path = data_directory / "PointCloud.las"
 
-footprints = dtcc.io.load_footprints(buildings_path, "uuid")
-
-pc = dtcc.io.load_pointcloud(pointcloud_path)
-pc = pc.remove_global_outliers(3)
-
-terrain_raster = dtcc.builder.build_terrain_raster(
-    pc, cell_size=2, radius=3, ground_only=True
-)
-
-# caluclate the building heights
-footprints = dtcc.builder.extract_roof_points(
-    footprints, pc, statistical_outlier_remover=True
-)
-
-footprints = dtcc.builder.compute_building_heights(
-    footprints, terrain_raster, overwrite=True
-)
+# load data, build terrain raster and calculate the building heights (cached)
+footprints, pc, terrain_raster = prepare_data(buildings_path, pointcloud_path)
 
 # merge and simplify the building footprints
 merged_footprints = dtcc.builder.merge_building_footprints(
@@ -53,22 +41,26 @@ simplifed_footprints = dtcc.builder.simplify_building_footprints(
 )
 clearance_fix = dtcc.builder.fix_building_footprint_clearance(simplifed_footprints, 0.5)
 
-# set subdomain resolution to half the building height
-subdomain_resolution = [building.height / 2 for building in clearance_fix]
+# drop missing buildings once so that all per-building lists line up
+valid_buildings = [building for building in clearance_fix if building is not None]
+
+# set subdomain resolution to half the building height, capped at the mesh size
+max_mesh_size = 10
+building_heights = np.fromiter(
+    (building.height for building in valid_buildings),
+    dtype=np.float64,
+    count=len(valid_buildings),
+)
+subdomain_resolution = np.minimum(building_heights * 0.5, max_mesh_size)
 
 # convert to C++ classes
 builder_dem = raster_to_builder_gridfield(terrain_raster)
 builder_surfaces = [
-    create_builder_surface(building.lod0)
-    for building in clearance_fix
-    if building is not None
+    create_builder_surface(building.lod0) for building in valid_buildings
 ]
 builder_footprints = [
-    create_builder_polygon(building.lod0.to_polygon())
-    for building in clearance_fix
-    if building is not None
+    create_builder_polygon(building.lod0.to_polygon()) for building in valid_buildings
 ]
-max_mesh_size = 10
 min_mesh_angle = 25
 smoothing = 3
 merge_meshes = True
@@ -80,13 +72,14 @@ smoothing_relative_tolerance = 0.001
 
 # Step 3.1: Build ground mesh
 
+bounds = terrain_raster.bounds
 builder_ground_mesh = _dtcc_builder.build_ground_mesh(
     builder_footprints,
     subdomain_resolution,
-    terrain_raster.bounds.xmin,
-    terrain_raster.bounds.ymin,
-    terrain_raster.bounds.xmax,
-    terrain_raster.bounds.ymax,
+    bounds.xmin,
+    bounds.ymin,
+    bounds.xmax,
+    bounds.ymax,
     max_mesh_size,
     min_mesh_angle,
     True,  # sort triangles
@@ -102,8 +95,9 @@ print(
 
 start_time = time()
 
-layer_heights = [2, 2, 4, 7, 10, 20]
-# layer_heights = [10, 10, 10, 10]
+layer_heights = np.asarray([2, 2, 4, 7, 10, 20], dtype=np.float64)
+# layer_heights = np.asarray([10, 10, 10, 10], dtype=np.float64)
+cumulative_layer_heights = np.cumsum(layer_heights)
 
 volume_mesh = _dtcc_builder.layer_ground_mesh(builder_ground_mesh, layer_heights)
 
@@ -123,7 +117,7 @@ print(
 
 # Step 3.3: mooth volume mesh (set ground height)
 
-domain_height = sum(layer_heights)
+domain_height = cumulative_layer_heights[-1]
 top_height = domain_height + terrain_raster.data.max()
 
 volume_mesh = _dtcc_builder.smooth_volume_mesh(
@@ -1,8 +1,17 @@
-from setuptools import setup
+from setuptools import setup, Extension
 from Cython.Build import cythonize
 import numpy
 
+extensions = [
+    Extension(
+        "vertex_extractor",
+        ["vertex_extractor.pyx"],
+        include_dirs=[numpy.get_include()],
+        extra_compile_args=["-O3", "-march=native"],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+    )
+]
+
 setup(
-    ext_modules=cythonize("vertex_extractor.pyx"),
-    include_dirs=[numpy.get_include()]
+    ext_modules=cythonize(extensions),
 )
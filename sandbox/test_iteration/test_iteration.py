@@ -21,15 +21,15 @@ for building in city.buildings:
 dt = time() - t
 print(f"A: {dt: .3g} s")
 
-# Option B: Python iteration and appending to a list
+# Option B: Python iteration, collecting arrays and stacking once
 t = time()
-vertices = []
+arrays = []
 for building in city.buildings:
     for building_part in building.building_parts:
         multi_surface = building_part.geometry[GeometryType.LOD2]
         for surface in multi_surface.surfaces:
-            vertices.extend(surface.vertices)
-vertices = np.array(vertices)
+            arrays.append(surface.vertices)
+vertices = np.vstack(arrays) if arrays else np.empty((0, 3))
 # print(np.shape(vertices), vertices[-1, :])
 dt = time() - t
 print(f"B: {dt: .3g} s")
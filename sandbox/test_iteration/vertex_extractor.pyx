@@ -1,16 +1,68 @@
 import numpy as np
 cimport numpy as cnp
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
 from dtcc_model.object.object import GeometryType
 
+cnp.import_array()
+
+
 def extract_vertices(city):
-    cdef list all_vertices = []
-    cdef cnp.ndarray[cnp.float64_t, ndim=2] surface_vertices
+    # The blocks list keeps the contiguous arrays alive while their data
+    # pointers are used below
+    cdef list blocks = []
+    cdef cnp.ndarray[cnp.float64_t, ndim=2, mode="c"] surface_vertices
+    cdef double[:, ::1] out
+    cdef double* dst
+    cdef double** sources
+    cdef Py_ssize_t* num_rows
+    cdef Py_ssize_t num_blocks
+    cdef Py_ssize_t total = 0
+    cdef Py_ssize_t offset = 0
+    cdef Py_ssize_t k
 
+    # First pass: collect contiguous vertex blocks and count rows
     for building in city.buildings:
         for building_part in building.building_parts:
             multi_surface = building_part.geometry[GeometryType.LOD2]
             for surface in multi_surface.surfaces:
-                surface_vertices = surface.vertices
-                all_vertices.append(surface_vertices)
+                block = np.ascontiguousarray(surface.vertices, dtype=np.float64)
+                if block.ndim != 2 or block.shape[1] != 3:
+                    raise ValueError(
+                        f"Expected surface vertices of shape (n, 3), got {block.shape}"
+                    )
+                blocks.append(block)
+                total += block.shape[0]
+
+    vertices = np.empty((total, 3))
+    if total == 0:
+        return vertices
+    out = vertices
+    dst = &out[0, 0]
+
+    # Store data pointers and row counts in C arrays so that all copies can
+    # be done without holding the GIL
+    num_blocks = len(blocks)
+    sources = <double**> malloc(num_blocks * sizeof(double*))
+    num_rows = <Py_ssize_t*> malloc(num_blocks * sizeof(Py_ssize_t))
+    if sources == NULL or num_rows == NULL:
+        free(sources)
+        free(num_rows)
+        raise MemoryError()
+
+    try:
+        for k in range(num_blocks):
+            surface_vertices = blocks[k]
+            sources[k] = <double*> cnp.PyArray_DATA(surface_vertices)
+            num_rows[k] = surface_vertices.shape[0]
+
+        # Second pass: copy each block straight into the output buffer
+        with nogil:
+            for k in range(num_blocks):
+                memcpy(dst + 3 * offset, sources[k], num_rows[k] * 3 * sizeof(double))
+                offset += num_rows[k]
+    finally:
+        free(sources)
+        free(num_rows)
 
-    return np.vstack(all_vertices)
+    return vertices
@@ -1,9 +1,9 @@
-# Import core submodules
-
-from dtcc_core import common as common
-from dtcc_core import model as model
-from dtcc_core import io as io
-from dtcc_core import builder as builder
+# Standard library imports (aliased so they are not exposed as dtcc.<name>)
+import ast as _ast
+import functools as _functools
+import importlib as _importlib
+import importlib.util as _importlib_util
+import sys as _sys
 
 import dtcc_data as data
 
@@ -11,62 +11,232 @@ import dtcc_data as data
 from .logging import debug, info, warning, error, critical
 
 
-modules = [common, model, io, builder,]
-
-# Try to import dtcc_viewer. 
-# Checking if dtcc_viewer is pip installed and if there is graphical environment
-try:
-    import dtcc_viewer as viewer
-    import glfw
-
-    def is_graphical_available():
-        """Check if OpenGL via GLFW can be initialized."""
-        if not glfw.init():
-            return False
-        glfw.terminate()
-        return True
-    
-    if not is_graphical_available():
-        raise ImportError("Failed to initialize GLFW. You are likely in a headless or non-graphical environment.")
-    
-    # Add dtcc_viewer to the list of modules if graphical environment is available
-    modules.append(viewer)
-
-except ImportError:
-    # Define a default method to provide feedback when dtcc-viewer is not available
-    def default_view(self,*args,**kwargs):
-       warning(f"Cannot view object: {self.__class__.__name__}. The dtcc-viewer module is not installed or graphical rendering is not available. "
-               "Please install dtcc-viewer using 'pip install dtcc-viewer'.")
-    
-    def _attach_default_view_to_model_classes():
-        """Attach the default_view method to model classes that are subclasses of Model."""
-        import inspect
-        # Import Model locally within the function
-        from dtcc_core.model.model import Model as _Model
-
-        dtcc_model_classes = [
-            member for _, member in inspect.getmembers(model) 
-            if inspect.isclass(member) and issubclass(member, _Model)
+# Submodules of dtcc-core whose public names are re-exported by dtcc. The
+# submodules (and the names in them) are resolved lazily on first access,
+# see __getattr__ below.
+_core_modules = {
+    "common": "dtcc_core.common",
+    "model": "dtcc_core.model",
+    "io": "dtcc_core.io",
+    "builder": "dtcc_core.builder",
+}
+
+
+def _peek_all(module_name, fallback_import=True):
+    """Read __all__ of a module from its source without importing it.
+
+    If __all__ is not a single literal list, the module is imported to read
+    __all__. With fallback_import=False the module is never imported;
+    instead an empty list is returned if the module is not installed, and
+    None if it is installed but its __all__ cannot be read from source."""
+    spec = _importlib_util.find_spec(module_name)
+    if spec is None and not fallback_import:
+        return []
+    if spec is not None and spec.origin and spec.origin.endswith(".py"):
+        with open(spec.origin, "rb") as f:
+            tree = _ast.parse(f.read())
+        assignments = [
+            node
+            for node in tree.body
+            if isinstance(node, _ast.Assign)
+            and any(isinstance(t, _ast.Name) and t.id == "__all__" for t in node.targets)
         ]
-
-        for model_class in dtcc_model_classes:
-            model_class.add_methods(default_view, "view")
-
-    # Call the function to attach the default view method
-    _attach_default_view_to_model_classes()
-
-__all__ = []
-for module in modules:
-    for name in module.__all__:
-        globals()[name] = getattr(module, name)
-    __all__ += module.__all__
-
-__all__ += ["debug", "info", "warning", "error", "critical"]
-
+        references = [
+            node
+            for node in _ast.walk(tree)
+            if isinstance(node, _ast.Name) and node.id == "__all__"
+        ]
+        if len(assignments) == 1 and len(references) == 1:
+            try:
+                return list(_ast.literal_eval(assignments[0].value))
+            except ValueError:
+                pass
+    if not fallback_import:
+        return None
+    return list(_importlib.import_module(module_name).__all__)
+
+
+# Map from re-exported name to the module that defines it (later modules
+# take precedence, as with the previous star-import)
+_name_to_module = {}
+for _module_name in _core_modules.values():
+    _name_to_module.update(dict.fromkeys(_peek_all(_module_name), _module_name))
+del _module_name
 
 # Import parameters from dtcc-builder. We should think about how to do this in a
 # good way, perhaps we can have a common parameter set defined in dtcc-common
 # and then all modules extend the parameter set with their own parameters.
-from dtcc_core.builder import parameters
-
-__all__.append("parameters")
\ No newline at end of file
+_name_to_module["parameters"] = "dtcc_core.builder"
+
+# Names exported by dtcc_viewer are mapped without importing the viewer, and
+# are only available if the viewer can be loaded (see _load_viewer). Names
+# also exported by dtcc-core resolve to dtcc-core.
+_viewer_names = _peek_all("dtcc_viewer", fallback_import=False)
+_name_to_module.update(
+    {n: "dtcc_viewer" for n in _viewer_names or () if n not in _name_to_module}
+)
+
+# The viewer (dtcc_viewer and glfw) is imported lazily, on first access to
+# dtcc.viewer or on the first call to .view() on a model object. Importing
+# dtcc_viewer attaches the real view methods to the model classes, so until
+# then the model classes carry a stub that loads the viewer on demand.
+@_functools.lru_cache(maxsize=1)
+def _load_viewer():
+    """Import dtcc_viewer if it is installed and a graphical environment is
+    available, otherwise return None."""
+    try:
+        import glfw
+    except ImportError:
+        return None
+
+    # Check if OpenGL via GLFW can be initialized
+    if not glfw.init():
+        return None
+    glfw.terminate()
+
+    try:
+        import dtcc_viewer
+    except ImportError:
+        return None
+
+    return dtcc_viewer
+
+
+def default_view(self, *args, **kwargs):
+    """View object, loading dtcc-viewer on first use."""
+    if _load_viewer() is None:
+        warning(
+            f"Cannot view object: {self.__class__.__name__}. The dtcc-viewer module is not installed or graphical rendering is not available. "
+            "Please install dtcc-viewer using 'pip install dtcc-viewer'."
+        )
+        return
+    if type(self).view is default_view:
+        warning(
+            f"Cannot view object: {self.__class__.__name__}. "
+            "dtcc-viewer does not provide a view method for this type."
+        )
+        return
+    return self.view(*args, **kwargs)
+
+
+_default_view_attached = False
+
+
+def _attach_default_view_to_model_classes():
+    """Attach the default_view method to the Model base class."""
+    global _default_view_attached
+    if _default_view_attached:
+        return
+
+    # If dtcc_viewer has already been imported, the real view methods are
+    # attached and must not be replaced by the stub
+    if "dtcc_viewer" in _sys.modules:
+        _default_view_attached = True
+        return
+
+    # Use Model as re-exported by the model package if available, and only
+    # fall back to importing the submodule that defines it
+    model = _importlib.import_module("dtcc_core.model")
+    _Model = getattr(model, "Model", None)
+    if _Model is None:
+        _Model = _importlib.import_module("dtcc_core.model.model").Model
+
+    # The stub is only attached to the base class, so that the subclasses
+    # inherit whichever view method dtcc_viewer attaches, whether it does so
+    # on the base class or on the subclasses
+    if "view" not in vars(_Model):
+        _Model.add_methods(default_view, "view")
+
+    _default_view_attached = True
+
+
+# Call the function to attach the default view method
+_attach_default_view_to_model_classes()
+
+
+def _available_viewer_names():
+    """Return the names exported by dtcc_viewer if the viewer can be loaded,
+    otherwise an empty list."""
+    viewer = _load_viewer()
+    if viewer is None:
+        return []
+
+    # Map any names that could not be read from source (names also exported
+    # by dtcc-core resolve to dtcc-core)
+    names = []
+    for name in getattr(viewer, "__all__", ()):
+        if name not in _name_to_module:
+            _name_to_module[name] = "dtcc_viewer"
+        if _name_to_module[name] == "dtcc_viewer":
+            names.append(name)
+
+    return names
+
+
+def __getattr__(name):
+    if name == "__all__":
+        # The viewer names are only published if the viewer can be loaded,
+        # so that "from dtcc import *" works without a graphical environment
+        value = _core_all + _available_viewer_names()
+    elif name in _core_modules:
+        value = _importlib.import_module(_core_modules[name])
+    elif _name_to_module.get(name) == "dtcc_viewer":
+        viewer = _load_viewer()
+        if viewer is None:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} "
+                "(dtcc-viewer is not installed or graphical rendering is not available)"
+            )
+        value = getattr(viewer, name)
+    elif name in _name_to_module:
+        value = getattr(_importlib.import_module(_name_to_module[name]), name)
+    elif name == "viewer" and _load_viewer() is not None:
+        value = _load_viewer()
+    elif _viewer_names is None and name in _available_viewer_names():
+        # The viewer names could not be read from source, so check the
+        # loaded viewer
+        value = getattr(_load_viewer(), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    # Leave out private names (including the aliased standard library
+    # imports) so that dir(dtcc) only lists the public API
+    public_names = [
+        n for n in globals() if not n.startswith("_") or n.startswith("__")
+    ]
+    core_names = [n for n, m in _name_to_module.items() if m != "dtcc_viewer"]
+
+    # List the viewer names known so far without loading the viewer, since
+    # that initializes GLFW (dir() is called by tab completion). The names
+    # are left out if the viewer has already turned out to be unusable.
+    viewer_names = []
+    viewer_probed = _load_viewer.cache_info().currsize > 0
+    if not viewer_probed or _load_viewer() is not None:
+        viewer_names = [n for n, m in _name_to_module.items() if m == "dtcc_viewer"]
+        if _importlib_util.find_spec("dtcc_viewer") is not None:
+            viewer_names.append("viewer")
+    return sorted(
+        set(public_names) | set(_core_modules) | set(core_names) | set(viewer_names)
+    )
+
+
+# Build the core part of __all__ once, without duplicates (names are unique as
+# dict keys). The full __all__, including the viewer names, is resolved
+# lazily by __getattr__.
+_core_all = list(
+    dict.fromkeys(
+        [
+            *(n for n, m in _name_to_module.items() if m != "dtcc_viewer"),
+            "debug",
+            "info",
+            "warning",
+            "error",
+            "critical",
+            "parameters",
+        ]
+    )
+)
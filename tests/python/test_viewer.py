@@ -0,0 +1,251 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+SRC_DIRECTORY = Path(__file__).resolve().parents[2] / "src"
+
+# Minimal stand-ins for dtcc-core, dtcc-data, dtcc-viewer and glfw, so that
+# the lazy viewer handling in dtcc/__init__.py can be tested in isolation
+STUB_PACKAGES = {
+    "dtcc_core/__init__.py": "",
+    "dtcc_core/common/__init__.py": """
+        import logging
+
+        def init_logging(name):
+            logger = logging.getLogger(name)
+            return (
+                logger.debug,
+                logger.info,
+                logger.warning,
+                logger.error,
+                logger.critical,
+            )
+
+        __all__ = ["init_logging"]
+    """,
+    "dtcc_core/model/__init__.py": """
+        class Model:
+            @classmethod
+            def add_methods(cls, method, name):
+                setattr(cls, name, method)
+
+        class City(Model):
+            pass
+
+        __all__ = ["Model", "City"]
+    """,
+    "dtcc_core/io/__init__.py": "__all__ = []",
+    "dtcc_core/builder/__init__.py": """
+        parameters = {}
+        __all__ = []
+    """,
+    "dtcc_data/__init__.py": "",
+    "dtcc_viewer/__init__.py": """
+        from dtcc_core.model import City
+
+        def view(self, *args, **kwargs):
+            print("real view")
+
+        City.add_methods(view, "view")
+
+        class Window:
+            pass
+
+        class Scene:
+            pass
+
+        __all__ = ["Window", "Scene"]
+    """,
+    "glfw.py": """
+        import os
+
+        def init():
+            print("glfw init")
+            return os.environ.get("STUB_GLFW_HEADLESS") is None
+
+        def terminate():
+            pass
+    """,
+}
+
+
+class TestViewer(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.stub_directory = Path(self._tmp.name)
+        for path, source in STUB_PACKAGES.items():
+            path = self.stub_directory / path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(textwrap.dedent(source))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def run_python(self, code, headless=False):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(
+            [str(SRC_DIRECTORY), str(self.stub_directory)]
+        )
+        env.pop("STUB_GLFW_HEADLESS", None)
+        if headless:
+            env["STUB_GLFW_HEADLESS"] = "1"
+        result = subprocess.run(
+            [sys.executable, "-c", textwrap.dedent(code)],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout, result.stderr
+
+    def test_view_viewer_imported_first(self):
+        stdout, stderr = self.run_python(
+            """
+            import dtcc_viewer
+            import dtcc
+            dtcc.City().view()
+            """
+        )
+        self.assertIn("real view", stdout)
+        self.assertNotIn("Cannot view object", stderr)
+
+    def test_view_viewer_imported_on_demand(self):
+        stdout, stderr = self.run_python(
+            """
+            import sys
+            import dtcc
+            assert "dtcc_viewer" not in sys.modules
+            dtcc.City().view()
+            """
+        )
+        self.assertIn("real view", stdout)
+        self.assertNotIn("Cannot view object", stderr)
+
+    def test_view_viewer_attached_to_base_class(self):
+        viewer_init = self.stub_directory / "dtcc_viewer" / "__init__.py"
+        source = viewer_init.read_text()
+        source = source.replace("import City", "import Model")
+        source = source.replace("City.add_methods", "Model.add_methods")
+        viewer_init.write_text(source)
+        stdout, stderr = self.run_python(
+            """
+            import dtcc
+            dtcc.City().view()
+            """
+        )
+        self.assertIn("real view", stdout)
+        self.assertNotIn("Cannot view object", stderr)
+
+    def test_view_headless(self):
+        stdout, stderr = self.run_python(
+            """
+            import dtcc
+            dtcc.City().view()
+            """,
+            headless=True,
+        )
+        self.assertNotIn("real view", stdout)
+        self.assertIn("Cannot view object: City", stderr)
+
+    def test_viewer_names(self):
+        stdout, _ = self.run_python(
+            """
+            import dtcc
+            assert "Window" in dtcc.__all__ and "Scene" in dtcc.__all__
+            assert dtcc.Window is dtcc.viewer.Window
+            from dtcc import *
+            print(Window.__name__, Scene.__name__, City.__name__)
+            """
+        )
+        self.assertIn("Window Scene City", stdout)
+
+    def test_viewer_names_non_literal_all(self):
+        viewer_init = self.stub_directory / "dtcc_viewer" / "__init__.py"
+        source = viewer_init.read_text()
+        source = source.replace(
+            '__all__ = ["Window", "Scene"]',
+            '__all__ = ["Window"]\n__all__ += ["Scene"]',
+        )
+        viewer_init.write_text(source)
+        stdout, _ = self.run_python(
+            """
+            import dtcc
+            assert dtcc.viewer.Window is dtcc.Window
+            assert dtcc.Scene is dtcc.viewer.Scene
+            assert "Window" in dtcc.__all__ and "Scene" in dtcc.__all__
+            print("ok")
+            """
+        )
+        self.assertIn("ok", stdout)
+
+    def test_viewer_names_headless(self):
+        stdout, _ = self.run_python(
+            """
+            import dtcc
+            assert "Window" not in dtcc.__all__
+            try:
+                dtcc.Window
+            except AttributeError:
+                print("no Window")
+            from dtcc import *
+            print(City.__name__)
+            """,
+            headless=True,
+        )
+        self.assertIn("no Window", stdout)
+        self.assertIn("City", stdout)
+
+    def test_viewer_not_installed(self):
+        shutil.rmtree(self.stub_directory / "dtcc_viewer")
+        stdout, stderr = self.run_python(
+            """
+            import dtcc
+            assert "Window" not in dtcc.__all__
+            dtcc.City().view()
+            """
+        )
+        self.assertIn("Cannot view object: City", stderr)
+
+    def test_dir_lists_public_modules_only(self):
+        stdout, _ = self.run_python(
+            """
+            import inspect
+            import dtcc
+            modules = [n for n in dir(dtcc) if inspect.ismodule(getattr(dtcc, n))]
+            print(sorted(modules))
+            """
+        )
+        self.assertEqual(
+            stdout.splitlines()[-1],
+            str(["builder", "common", "data", "io", "logging", "model", "viewer"]),
+        )
+
+    def test_dir_does_not_load_viewer(self):
+        stdout, _ = self.run_python(
+            """
+            import sys
+            import dtcc
+            names = dir(dtcc)
+            assert "dtcc_viewer" not in sys.modules
+            print("Window" in names, "viewer" in names)
+            """
+        )
+        self.assertNotIn("glfw init", stdout)
+        self.assertIn("True True", stdout)
+
+    def test_dir_headless(self):
+        stdout, _ = self.run_python(
+            """
+            import dtcc
+            dtcc.City().view()
+            names = dir(dtcc)
+            print("Window" in names, "viewer" in names)
+            """,
+            headless=True,
+        )
+        self.assertIn("False False", stdout)